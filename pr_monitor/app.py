@@ -5,21 +5,135 @@ A TUI application for monitoring pull requests across multiple GitHub accounts.
 """
 
 import asyncio
+import functools
+import hashlib
+import json
+import operator
 import os
-import webbrowser
+import re
+import sys
+import time
 from datetime import date, datetime, timedelta, timezone
 from enum import IntEnum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 import yaml
-from dateutil.parser import parse as parse_date
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical
 from textual.widgets import DataTable, Footer, Header, Static
 from textual.binding import Binding
 
+# Prefer libyaml's C loader; fall back to the pure-Python one when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Manual refreshes within this many seconds of the last one are ignored
+REFRESH_DEBOUNCE_SECONDS = 2.0
+
+# Max concurrent check-status lookups per account (keeps clear of secondary rate limits)
+CHECK_STATUS_CONCURRENCY = 10
+
+# Labels on your own PR that mean it needs work ("wip", "changes-requested", "blocked", ...).
+# Alphanumeric lookarounds instead of \b so "changes_requested" still matches but "unblocked" doesn't.
+ATTENTION_LABEL_RE = re.compile(r"(?<![a-z0-9])(?:changes|requested|wip|blocked)(?![a-z0-9])", re.IGNORECASE)
+
+# (header, column key) for each DataTable column; column keys double as row_data fields
+TABLE_COLUMNS = (
+    ("Status", "status"),
+    ("Checks", "checks"),
+    ("Account", "account"),
+    ("Type", "state"),
+    ("Repo", "repo"),
+    ("Title", "title"),
+    ("Author", "author"),
+    ("Age", "age"),
+)
+
+# Row order within a box: priority, then age (newest first)
+ROW_SORT_KEY = operator.itemgetter("priority", "age_seconds")
+
+# statusCheckRollup.state (GraphQL) -> Checks column emoji
+ROLLUP_STATE_EMOJI = {
+    "SUCCESS": "✅",
+    "PENDING": "🟡",
+    "EXPECTED": "🟡",
+    "FAILURE": "❌",
+    "ERROR": "❌",
+}
+
+# Combined commit status state (REST fallback) -> Checks column emoji
+COMMIT_STATE_EMOJI = {
+    "success": "✅",
+    "pending": "🟡",
+    "failure": "❌",
+    "error": "❌",
+}
+
+# PRs per GraphQL check query; keeps each query well inside GitHub's timeout and
+# node limits, and a failed batch only sends its own rows to the REST fallback
+GRAPHQL_BATCH_SIZE = 50
+
+# Per-PR fields requested by fetch_checks_graphql
+PR_CHECKS_GRAPHQL_FIELDS = (
+    "reviewRequests(first: 50) { nodes { requestedReviewer { "
+    "... on User { login } ... on Team { slug } } } } "
+    "commits(last: 1) { nodes { commit { statusCheckRollup { state } } } }"
+)
+
+# Max number of ETag-validated responses kept for conditional requests (least recently used evicted first)
+ETAG_CACHE_SIZE = 2000
+
+# How long a login persisted in usernames.json is trusted before /user is asked again
+# (accounts can be renamed without the token changing)
+USERNAME_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def cache_dir() -> Path:
+    """Return the pr-monitor cache directory (XDG-aware, not created)."""
+    xdg_cache_home = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return xdg_cache_home / "pr-monitor"
+
+
+def graphql_url(api_base: str) -> str:
+    """Map a REST API base to its GraphQL endpoint (GHE serves it at /api/graphql, not /api/v3/graphql)."""
+    api_base = api_base.rstrip("/")
+    if api_base.endswith("/api/v3"):
+        return api_base[: -len("/v3")] + "/graphql"
+    return f"{api_base}/graphql"
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp; the same created_at values recur every refresh.
+
+    Raises:
+        ValueError: If the value is not ISO 8601
+    """
+    # GitHub always sends e.g. "2024-01-02T03:04:05Z"; fromisoformat only accepts "Z" on 3.11+
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=64)
+def build_search_query(base_query: str, repos: tuple[str, ...], closed_cutoff: date | None) -> str:
+    """Join a box query with repo scopes and an optional closed-since cutoff; identical every refresh."""
+    parts = base_query.split()
+
+    for repo in repos:
+        parts.append(f"repo:{repo}")
+
+    if closed_cutoff:
+        parts.append(f"closed:>{closed_cutoff}")
+
+    return " ".join(parts)
+
 
 class Priority(IntEnum):
     """PR priority levels (lower number = higher priority)."""
@@ -93,10 +207,18 @@ class PRDashboard(App):
     def __init__(self):
         super().__init__()
         self.config = None
+        self.http: httpx.AsyncClient | None = None  # Shared client, open for the app's lifetime
         self.pr_urls = {}  # Maps row keys to PR URLs
         self.last_update = None
+        self._refreshing = asyncio.Lock()  # Held while a refresh's search phase runs
+        self._last_refresh_ts = 0.0  # time.monotonic() when the last refresh started
         self.usernames = {}  # Cache: token_env_var -> username
+        self.saved_usernames: dict[str, tuple[str, float]] = {}  # Persisted: hash of (api_base, token) -> (username, resolved at)
+        self._username_lookups: dict[str, asyncio.Future] = {}  # In-flight /user requests
+        self.etag_cache: dict[str, tuple[str, Any]] = {}  # Cache: request key -> (ETag, parsed JSON)
         self.query_labels = []  # Track unique query labels for section organization
+        self._sections: dict[str, tuple[Vertical, Static, DataTable]] = {}  # Box label -> mounted widgets
+        self._row_state: dict[tuple[str, str], dict[str, Any]] = {}  # (box label, row key) -> displayed row
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -108,8 +230,18 @@ class PRDashboard(App):
 
     def on_mount(self) -> None:
         """Set up the application on mount."""
-        # Load config and initial data
+        # One pooled client for every request so keep-alive connections survive across refreshes;
+        # HTTP/2 multiplexes the concurrent searches and check lookups over one connection per host
+        self.http = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+
+        # Load config, cached responses and initial data
         self.load_config()
+        self._load_etag_cache()
+        self._load_usernames()
 
         # Trigger initial data fetch
         self.run_worker(self.refresh_data())
@@ -121,6 +253,65 @@ class PRDashboard(App):
 
         self.set_interval(refresh_interval, self.refresh_data)
 
+    async def on_unmount(self) -> None:
+        """Close the shared HTTP client and persist the ETag cache."""
+        if self.http is not None:
+            await self.http.aclose()
+        self._save_etag_cache()
+
+    def _load_etag_cache(self) -> None:
+        """Restore ETag-validated responses saved by a previous run (best effort)."""
+        try:
+            entries = orjson.loads((cache_dir() / "etags.json").read_bytes())
+            self.etag_cache = {key: (etag, data) for key, etag, data in entries}
+        except (OSError, ValueError, TypeError):
+            self.etag_cache = {}
+
+    def _save_etag_cache(self) -> None:
+        """Persist the ETag cache so the next launch can revalidate instead of refetch."""
+        cache_path = cache_dir() / "etags.json"
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            payload = orjson.dumps([[key, etag, data] for key, (etag, data) in self.etag_cache.items()])
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Bodies may describe private repositories: create the file owner-only from the start
+            # (a leftover temp file could carry looser permissions, so never reuse one)
+            tmp_path.unlink(missing_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            tmp_path.replace(cache_path)
+        except (OSError, TypeError):
+            pass
+
+    def _load_usernames(self) -> None:
+        """Restore logins resolved by a previous run so startup can skip /user (best effort)."""
+        try:
+            saved = orjson.loads((cache_dir() / "usernames.json").read_bytes())
+        except (OSError, ValueError):
+            saved = {}
+        if not isinstance(saved, dict):
+            saved = {}
+        # Drop expired entries and any in an unexpected shape
+        now = time.time()
+        self.saved_usernames = {
+            key: (entry[0], entry[1])
+            for key, entry in saved.items()
+            if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], str)
+            and isinstance(entry[1], (int, float)) and now - entry[1] < USERNAME_CACHE_TTL_SECONDS
+        }
+
+    def _save_usernames(self) -> None:
+        """Persist resolved logins; written whenever a token's login is (re-)resolved."""
+        cache_path = cache_dir() / "usernames.json"
+        tmp_path = cache_path.with_suffix(".tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(self.saved_usernames))
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass
+
     def load_config(self) -> None:
         """Load configuration from ~/.config/pr-monitor/config.yaml."""
         xdg_config_home = Path(os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config"))
@@ -132,14 +323,39 @@ class PRDashboard(App):
             return
 
         try:
-            with open(config_path, "r") as f:
-                self.config = yaml.safe_load(f)
+            # Reuse the parsed config from the JSON sidecar while config.yaml is unchanged
+            source_mtime = config_path.stat().st_mtime_ns
+            cache_path = cache_dir() / "config.json"
+            self.config = self._read_config_cache(cache_path, source_mtime)
+            if self.config is None:
+                with open(config_path, "r") as f:
+                    self.config = yaml.load(f, Loader=_YamlLoader)
+                self._write_config_cache(cache_path, source_mtime, self.config)
             if "boxes" not in self.config:
                 self.config["boxes"] = []
         except Exception as e:
             self.show_error(f"Error loading config.yaml: {e}")
             self.config = {"accounts": [], "boxes": []}
 
+    def _read_config_cache(self, cache_path: Path, source_mtime: int) -> dict | None:
+        """Return the cached config if it was written for this config.yaml mtime, else None."""
+        try:
+            cached = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("source_mtime_ns") != source_mtime:
+            return None
+        return cached.get("config")
+
+    def _write_config_cache(self, cache_path: Path, source_mtime: int, config: Any) -> None:
+        """Best-effort write of the parsed config; skipped if it isn't JSON-serializable."""
+        try:
+            payload = json.dumps({"source_mtime_ns": source_mtime, "config": config})
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(payload)
+        except (OSError, TypeError, ValueError):
+            pass
+
     def show_error(self, message: str) -> None:
         """Display an error message."""
         self.notify(message, severity="error", timeout=10)
@@ -155,17 +371,9 @@ class PRDashboard(App):
         Returns:
             Query string ready to pass to the search API
         """
-        parts = box["query"].split()
-
-        for repo in account.get("repos", []):
-            parts.append(f"repo:{repo}")
-
         days = box.get("closed_since_days")
-        if days:
-            cutoff = date.today() - timedelta(days=int(days))
-            parts.append(f"closed:>{cutoff}")
-
-        return " ".join(parts)
+        cutoff = date.today() - timedelta(days=int(days)) if days else None
+        return build_search_query(box["query"], tuple(account.get("repos", [])), cutoff)
 
     def _resolve_box_accounts(self, box: dict, accounts_by_id: dict) -> list[dict]:
         """
@@ -195,23 +403,108 @@ class PRDashboard(App):
         if token_env_var in self.usernames:
             return self.usernames[token_env_var]
 
+        # Reuse a login resolved by a recent run. Keyed by a hash of host and token, so a rotated
+        # token or new host misses; entries expire so an account rename is picked up within a day
+        saved_key = hashlib.sha256(f"{api_base} {token}".encode()).hexdigest()
+        saved = self.saved_usernames.get(saved_key)
+        if saved is not None and time.time() - saved[1] < USERNAME_CACHE_TTL_SECONDS:
+            self.usernames[token_env_var] = saved[0]
+            return saved[0]
+
+        # Boxes for the same account are fetched concurrently, so share a single
+        # in-flight /user lookup between them instead of issuing one per box
+        lookup = self._username_lookups.get(token_env_var)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self._fetch_username(api_base, token, token_env_var, saved_key))
+            self._username_lookups[token_env_var] = lookup
+            lookup.add_done_callback(lambda _: self._username_lookups.pop(token_env_var, None))
+
+        return await asyncio.shield(lookup)
+
+    async def _fetch_username(self, api_base: str, token: str, token_env_var: str, saved_key: str) -> str:
+        """Hit /user for a token, cache the login under its token_env_var and persist it under saved_key."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                headers = {
-                    "Authorization": f"token {token}",
-                    "Accept": "application/vnd.github.v3+json",
-                }
-                response = await client.get(f"{api_base}/user", headers=headers)
+            headers = {
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github.v3+json",
+            }
+            response = await self.http.get(f"{api_base}/user", headers=headers)
 
-                if response.status_code == 200:
-                    username = response.json().get("login", "")
-                    self.usernames[token_env_var] = username
-                    return username
+            if response.status_code == 200:
+                username = orjson.loads(response.content).get("login", "")
+                self.usernames[token_env_var] = username
+                if username:
+                    self.saved_usernames[saved_key] = (username, time.time())
+                    self._save_usernames()
+                return username
         except Exception:
             pass
 
         return ""
 
+    async def _get_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, Any] | None = None,
+        transform: Callable[[Any], Any] | None = None
+    ) -> tuple[int, Any]:
+        """
+        GET a JSON resource, revalidating previously seen responses by ETag.
+
+        GitHub answers an unchanged resource with 304 Not Modified, which carries no
+        body and does not count against the rate limit; the cached body is reused.
+
+        Args:
+            client: HTTP client to use
+            url: Resource URL
+            headers: HTTP headers with auth
+            params: Optional query parameters
+            transform: Optional reducer applied to a 200 body before it is cached and
+                returned, so only what the caller needs is kept (and persisted)
+
+        Returns:
+            Tuple of (status_code, parsed_json). A 304 is reported as 200 with the
+            cached body; parsed_json is None if the body isn't JSON.
+        """
+        # Key on a hash of the credentials: responses differ per user, and the cache is
+        # persisted, so it must never contain the token itself
+        auth_hash = hashlib.sha256(headers.get("Authorization", "").encode()).hexdigest()[:16]
+        key = f"{auth_hash} {url}?{urlencode(sorted((params or {}).items()))}"
+        cached = self.etag_cache.get(key)
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        response = await client.get(url, headers=headers, params=params)
+
+        if response.status_code == 304 and cached:
+            # Move to the end so eviction drops least-recently-used entries (dead per-SHA
+            # lookups), not the searches that keep revalidating
+            self.etag_cache.pop(key, None)
+            self.etag_cache[key] = cached
+            return 200, cached[1]
+
+        try:
+            # Search responses run to hundreds of KB; orjson decodes them several times
+            # faster than the stdlib parser behind response.json()
+            data = orjson.loads(response.content)
+        except ValueError:
+            data = None
+
+        if transform is not None and response.status_code == 200 and data is not None:
+            data = transform(data)
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            # Re-insert so the dict stays in least-recently-used order for eviction
+            self.etag_cache.pop(key, None)
+            self.etag_cache[key] = (etag, data)
+            if len(self.etag_cache) > ETAG_CACHE_SIZE:
+                del self.etag_cache[next(iter(self.etag_cache))]
+
+        return response.status_code, data
+
     async def get_check_status(
         self,
         pr: dict[str, Any],
@@ -245,12 +538,10 @@ class PRDashboard(App):
                 return "⚪", reviewer_info  # Not a PR or URL not available
 
             # Fetch the full PR object
-            response = await client.get(pull_request_url, headers=headers)
-            if response.status_code != 200:
+            status_code, full_pr = await self._get_json(client, pull_request_url, headers)
+            if status_code != 200:
                 return "⚪", reviewer_info
 
-            full_pr = response.json()
-
             # Extract reviewer information
             reviewer_info["requested_reviewers"] = [
                 reviewer.get("login") for reviewer in full_pr.get("requested_reviewers", [])
@@ -269,62 +560,185 @@ class PRDashboard(App):
             if not repo_url:
                 return "⚪", reviewer_info
 
-            # Use the Check Runs API (newer, more reliable)
-            check_runs_url = f"{repo_url}/commits/{sha}/check-runs"
-            response = await client.get(
-                check_runs_url,
-                headers={**headers, "Accept": "application/vnd.github.v3+json"}
-            )
-
-            if response.status_code == 200:
-                check_data = response.json()
-                check_runs = check_data.get("check_runs", [])
-
-                if not check_runs:
-                    # No check runs, try the older commit status API
-                    status_url = f"{repo_url}/commits/{sha}/status"
-                    response = await client.get(status_url, headers=headers)
-
-                    if response.status_code == 200:
-                        status_data = response.json()
-                        state = status_data.get("state", "").lower()
-
-                        # Map commit status states to emoji
-                        status_map = {
-                            "success": "✅",
-                            "pending": "🟡",
-                            "failure": "❌",
-                            "error": "❌",
-                        }
-                        return status_map.get(state, "⚪"), reviewer_info
-
-                    return "⚪", reviewer_info  # No checks at all
-
-                # Process check runs
-                conclusions = [run.get("conclusion") for run in check_runs]
-                statuses = [run.get("status") for run in check_runs]
-
-                # If any are in progress or queued
-                if "in_progress" in statuses or "queued" in statuses:
-                    return "🟡", reviewer_info
-
-                # If any failed
-                if "failure" in conclusions or "timed_out" in conclusions or "action_required" in conclusions:
-                    return "❌", reviewer_info
-
-                # If all succeeded
-                if all(c == "success" for c in conclusions if c):
-                    return "✅", reviewer_info
-
-                # Neutral or skipped
-                return "⚪", reviewer_info
+            # Always revalidated: suites can still be added or re-run on the same SHA, and
+            # _get_json turns an unchanged check-runs response into a bodyless 304
+            checks = await self._get_commit_checks(repo_url, sha, headers, client)
+            return checks, reviewer_info
 
         except Exception:
             pass
 
         return "⚪", reviewer_info  # Default: no status or error
 
-    async def fetch_prs(self, box: dict, account: dict) -> tuple[str, str, str, list[dict[str, Any]]]:
+    async def _get_commit_checks(
+        self,
+        repo_url: str,
+        sha: str,
+        headers: dict[str, str],
+        client: httpx.AsyncClient
+    ) -> str:
+        """
+        Get the combined check status emoji for a commit via the REST API.
+
+        Args:
+            repo_url: API URL of the repository
+            sha: Commit SHA
+            headers: HTTP headers with auth
+            client: HTTP client to use
+
+        Returns:
+            Status emoji for the commit's check runs (or legacy commit status)
+        """
+        # Use the Check Runs API (newer, more reliable)
+        check_runs_url = f"{repo_url}/commits/{sha}/check-runs"
+        status_code, check_data = await self._get_json(
+            client,
+            check_runs_url,
+            {**headers, "Accept": "application/vnd.github.v3+json"}
+        )
+
+        if status_code == 200:
+            check_runs = check_data.get("check_runs", [])
+
+            if not check_runs:
+                # No check runs, try the older commit status API
+                status_url = f"{repo_url}/commits/{sha}/status"
+                status_code, status_data = await self._get_json(client, status_url, headers)
+
+                if status_code == 200:
+                    state = status_data.get("state", "").lower()
+                    return COMMIT_STATE_EMOJI.get(state, "⚪")
+
+                return "⚪"  # No checks at all
+
+            # Process check runs
+            conclusions = [run.get("conclusion") for run in check_runs]
+            statuses = [run.get("status") for run in check_runs]
+
+            # If any are in progress or queued
+            if "in_progress" in statuses or "queued" in statuses:
+                return "🟡"
+
+            # If any failed
+            if "failure" in conclusions or "timed_out" in conclusions or "action_required" in conclusions:
+                return "❌"
+
+            # If all succeeded
+            if all(c == "success" for c in conclusions if c):
+                return "✅"
+
+            # Neutral or skipped
+            return "⚪"
+
+        return "⚪"  # Check runs request failed
+
+    async def fetch_checks_graphql(
+        self,
+        rows: list[dict[str, Any]],
+        graphql_endpoint: str,
+        headers: dict[str, str],
+        client: httpx.AsyncClient
+    ) -> dict[str, tuple[str, dict[str, Any]]]:
+        """
+        Get check rollups and reviewer requests for many PRs via batched GraphQL queries.
+
+        Replaces the 2-3 REST calls get_check_status makes per PR with one aliased query
+        per GRAPHQL_BATCH_SIZE rows; batches are sent concurrently.
+
+        Args:
+            rows: Row dicts with "key", "repo" ("owner/repo") and "number"; rows sharing a
+                key are queried once
+            graphql_endpoint: GraphQL endpoint for the account (see graphql_url)
+            headers: HTTP headers with auth
+            client: HTTP client to use
+
+        Returns:
+            Dict mapping row key -> (status_emoji, reviewer_info_dict), in the same shape
+            as get_check_status. Rows the queries could not resolve are omitted, so the
+            caller can fall back to REST for them.
+        """
+        # A PR listed in several boxes has one row per box under the same key; query it once
+        unique_rows = list({row["key"]: row for row in rows}.values())
+        batches = await asyncio.gather(*[
+            self._fetch_checks_graphql_batch(
+                unique_rows[i:i + GRAPHQL_BATCH_SIZE], graphql_endpoint, headers, client
+            )
+            for i in range(0, len(unique_rows), GRAPHQL_BATCH_SIZE)
+        ])
+        return {key: result for batch in batches for key, result in batch.items()}
+
+    async def _fetch_checks_graphql_batch(
+        self,
+        rows: list[dict[str, Any]],
+        graphql_endpoint: str,
+        headers: dict[str, str],
+        client: httpx.AsyncClient
+    ) -> dict[str, tuple[str, dict[str, Any]]]:
+        """
+        Get check rollups and reviewer requests for a batch of PRs in one GraphQL request.
+
+        Builds one aliased repository/pullRequest lookup per row.
+
+        Args:
+            rows: Row dicts with "key", "repo" ("owner/repo") and "number"
+            graphql_endpoint: GraphQL endpoint for the account (see graphql_url)
+            headers: HTTP headers with auth
+            client: HTTP client to use
+
+        Returns:
+            Dict mapping row key -> (status_emoji, reviewer_info_dict), in the same shape
+            as get_check_status. Rows the query could not resolve are omitted, so the
+            caller can fall back to REST for them.
+        """
+        aliases = {}
+        selections = []
+        for i, row in enumerate(rows):
+            owner, _, name = row["repo"].partition("/")
+            alias = f"pr{i}"
+            aliases[alias] = row["key"]
+            # json.dumps produces a valid GraphQL string literal
+            selections.append(
+                f"{alias}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+                f"{{ pullRequest(number: {int(row['number'])}) {{ {PR_CHECKS_GRAPHQL_FIELDS} }} }}"
+            )
+
+        try:
+            response = await client.post(
+                graphql_endpoint,
+                headers=headers,
+                json={"query": "query { " + " ".join(selections) + " }"},
+            )
+            if response.status_code != 200:
+                return {}
+            # Partial errors (e.g. one inaccessible repo) still return data for the rest
+            data = orjson.loads(response.content).get("data") or {}
+        except Exception:
+            return {}
+
+        results = {}
+        for alias, key in aliases.items():
+            pull = (data.get(alias) or {}).get("pullRequest")
+            if not pull:
+                continue
+
+            reviewer_info = {"requested_reviewers": [], "requested_teams": []}
+            for request in (pull.get("reviewRequests") or {}).get("nodes") or []:
+                reviewer = (request or {}).get("requestedReviewer") or {}
+                if reviewer.get("login"):
+                    reviewer_info["requested_reviewers"].append(reviewer["login"])
+                elif reviewer.get("slug"):
+                    reviewer_info["requested_teams"].append(reviewer["slug"])
+
+            commits = (pull.get("commits") or {}).get("nodes") or []
+            rollup = ((commits[0] or {}).get("commit") or {}).get("statusCheckRollup") if commits else None
+            state = (rollup or {}).get("state")
+            results[key] = (ROLLUP_STATE_EMOJI.get(state, "⚪"), reviewer_info)
+
+        return results
+
+    async def fetch_prs(
+        self, box: dict, account: dict
+    ) -> tuple[str, str, str, list[dict[str, Any]], dict[str, str] | None]:
         """
         Fetch PRs for a single box + account combination.
 
@@ -333,7 +747,11 @@ class PRDashboard(App):
             account: Account configuration dictionary
 
         Returns:
-            Tuple: (account_label, username, box_label, list_of_prs)
+            Tuple: (account_label, username, box_label, list_of_prs, headers)
+            list_of_prs is None if the search failed (HTTP or network error), so the
+            caller can tell a failure apart from a box with no PRs
+            headers are the auth headers used for the search (None if the account has no token),
+            reused by phase 2 for the check lookups
         """
         account_label = account.get("label", account.get("id", "Unknown"))
         box_label = box.get("label", "PRs")
@@ -341,7 +759,7 @@ class PRDashboard(App):
         token_env_var = account.get("token_env_var")
         if not token_env_var:
             self.notify(f"No token_env_var configured for {account_label}", severity="warning")
-            return (account_label, "", box_label, [])
+            return (account_label, "", box_label, [], None)
 
         token = os.getenv(token_env_var)
         if not token:
@@ -349,7 +767,7 @@ class PRDashboard(App):
                 f"Token not found in environment variable {token_env_var} for {account_label}",
                 severity="warning"
             )
-            return (account_label, "", box_label, [])
+            return (account_label, "", box_label, [], None)
 
         api_base = account.get("api_base", "https://api.github.com")
         username = await self.get_authenticated_user(api_base, token, token_env_var)
@@ -361,49 +779,43 @@ class PRDashboard(App):
 
         query_string = self.build_query_for_box(box, account)
 
+        url = f"{api_base}/search/issues"
+        params = {"q": query_string, "per_page": 100}
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                url = f"{api_base}/search/issues"
-                params = {"q": query_string, "per_page": 100}
-                try:
-                    response = await client.get(url, headers=headers, params=params)
-                    if response.status_code == 200:
-                        return (account_label, username, box_label, response.json().get("items", []))
-                    else:
-                        error_msg = f"API error for {account_label} ({box_label}): HTTP {response.status_code}"
-                        try:
-                            error_data = response.json()
-                            if "message" in error_data:
-                                error_msg += f" - {error_data['message']}"
-                            if "errors" in error_data:
-                                error_msg += f" - Errors: {error_data['errors']}"
-                        except Exception:
-                            pass
-                        self.notify(error_msg, severity="error")
-                        return (account_label, username, box_label, [])
-                except Exception as e:
-                    self.notify(
-                        f"Error fetching {box_label} for {account_label}: {str(e)}",
-                        severity="error"
-                    )
-                    return (account_label, username, box_label, [])
+            status_code, data = await self._get_json(
+                self.http, url, headers, params, transform=self.slim_search_response
+            )
+            if status_code == 200:
+                return (account_label, username, box_label, data.get("items", []), headers)
+            else:
+                error_msg = f"API error for {account_label} ({box_label}): HTTP {status_code}"
+                if isinstance(data, dict):
+                    if "message" in data:
+                        error_msg += f" - {data['message']}"
+                    if "errors" in data:
+                        error_msg += f" - Errors: {data['errors']}"
+                self.notify(error_msg, severity="error")
+                return (account_label, username, box_label, None, headers)
         except Exception as e:
-            self.notify(f"Network error for {account_label}: {str(e)}", severity="error")
-            return (account_label, username, box_label, [])
+            self.notify(
+                f"Error fetching {box_label} for {account_label}: {str(e)}",
+                severity="error"
+            )
+            return (account_label, username, box_label, None, headers)
 
-    def calculate_age(self, created_at: str) -> str:
+    def calculate_age(self, created_at: str, now: datetime) -> str:
         """
         Calculate human-readable age from ISO timestamp.
 
         Args:
             created_at: ISO 8601 timestamp string
+            now: Reference time (aware, UTC); taken once per refresh so all rows agree
 
         Returns:
             Human-readable age string (e.g., "2h", "3d")
         """
         try:
-            created = parse_date(created_at)
-            now = datetime.now(timezone.utc)
+            created = parse_timestamp(created_at)
             delta = now - created
 
             if delta.days > 0:
@@ -417,7 +829,9 @@ class PRDashboard(App):
         except Exception:
             return "?"
 
-    def extract_repo_name(self, repo_url: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def extract_repo_name(repo_url: str) -> str:
         """
         Extract repository name from URL.
 
@@ -436,11 +850,43 @@ class PRDashboard(App):
         except Exception:
             return repo_url
 
+    @staticmethod
+    def slim_search_response(data: Any) -> Any:
+        """Reduce a /search/issues body to slimmed items before it is cached (see slim_pr)."""
+        if not isinstance(data, dict):
+            return data
+        return {"items": [PRDashboard.slim_pr(pr) for pr in data.get("items", [])]}
+
+    @staticmethod
+    def slim_pr(pr: dict[str, Any]) -> dict[str, Any]:
+        """
+        Reduce a search result to the fields the dashboard reads.
+
+        Keeps the GitHub shape so refresh_data, get_check_status and determine_pr_status
+        accept it unchanged, while the rest of the item (body, reactions, full user
+        objects, ...) is never held in the ETag cache or written to etags.json.
+        """
+        pull_request = pr.get("pull_request") or {}
+        return {
+            "id": pr.get("id"),
+            "number": pr.get("number"),
+            "state": pr.get("state"),
+            "draft": pr.get("draft", False),
+            "title": pr.get("title", ""),
+            "html_url": pr.get("html_url"),
+            "created_at": pr.get("created_at"),
+            "repository_url": pr.get("repository_url"),
+            "user": {"login": (pr.get("user") or {}).get("login", "")},
+            "assignees": [{"login": a.get("login", "")} for a in pr.get("assignees") or []],
+            "labels": [{"name": label.get("name", "")} for label in pr.get("labels") or []],
+            "pull_request": {"url": pull_request.get("url"), "merged_at": pull_request.get("merged_at")},
+        }
+
     def determine_pr_status(
         self,
         pr: dict[str, Any],
-        query_label: str,
-        username: str,
+        query_label_lc: str,
+        username_lc: str,
         reviewer_info: dict[str, Any] | None = None
     ) -> tuple[Priority, str]:
         """
@@ -448,8 +894,8 @@ class PRDashboard(App):
 
         Args:
             pr: PR data from GitHub API
-            query_label: The query label that found this PR
-            username: Current user's GitHub username
+            query_label_lc: The query label that found this PR, lowercased
+            username_lc: Current user's GitHub username, lowercased ("" if unknown)
             reviewer_info: Optional dict with 'requested_reviewers' and 'requested_teams' lists
 
         Returns:
@@ -461,14 +907,17 @@ class PRDashboard(App):
             return Priority.LOW, "⚫ Closed"
 
         author = pr.get("user", {}).get("login", "")
-        is_my_pr = author.lower() == username.lower() if username else False
+        is_my_pr = author.lower() == username_lc if username_lc else False
 
         # Check for assignment
-        assignees = pr.get("assignees", [])
-        is_assigned = any(a.get("login", "").lower() == username.lower() for a in assignees) if username else False
+        if username_lc:
+            assignee_logins = {a.get("login", "").lower() for a in pr.get("assignees", [])}
+            is_assigned = username_lc in assignee_logins
+        else:
+            is_assigned = False
 
         # Check if this is a review request query
-        is_review_request_query = "review-requested:@me" in query_label.lower() or "review requested" in query_label.lower()
+        is_review_request_query = "review-requested:@me" in query_label_lc or "review requested" in query_label_lc
 
         # Differentiate between individual and team review requests
         is_individual_review_request = False
@@ -476,8 +925,8 @@ class PRDashboard(App):
 
         if is_review_request_query and reviewer_info:
             # Check if user is individually requested
-            requested_reviewers = reviewer_info.get("requested_reviewers", [])
-            is_individual_review_request = username in requested_reviewers if username else False
+            requested_reviewers = {login.lower() for login in reviewer_info.get("requested_reviewers", []) if login}
+            is_individual_review_request = username_lc in requested_reviewers if username_lc else False
 
             # Check if there are team requests (and user wasn't individually requested)
             requested_teams = reviewer_info.get("requested_teams", [])
@@ -503,12 +952,11 @@ class PRDashboard(App):
         # MEDIUM: Your PR with changes requested or needs attention
         if is_my_pr:
             # Check labels for changes requested or similar
-            labels = [label.get("name", "").lower() for label in pr.get("labels", [])]
-            if any(word in " ".join(labels) for word in ["changes", "requested", "wip", "blocked"]):
+            if any(ATTENTION_LABEL_RE.search(label.get("name", "")) for label in pr.get("labels", [])):
                 return Priority.MEDIUM, "🟡 Changes Needed"
 
             # Check if it's approved (we can infer from query or check later)
-            if "approved" in query_label.lower():
+            if "approved" in query_label_lc:
                 return Priority.LOW, "🟢 Approved"
 
             # Default for user's PRs
@@ -522,14 +970,27 @@ class PRDashboard(App):
         if not self.config or not self.config.get("boxes"):
             return
 
-        self.pr_urls.clear()
+        # A slow refresh can outlast the timer interval; drop ticks instead of stacking them
+        if self._refreshing.locked():
+            return
+        async with self._refreshing:
+            self._last_refresh_ts = time.monotonic()
+            await self._refresh_data()
+
+    async def _refresh_data(self) -> None:
+        """Run one refresh: search every box, sync the tables, then start loading checks."""
+        # Stop patching the current board; it is about to be re-synced
+        self.workers.cancel_group(self, "checks")
 
+        # The current rows (and their URLs) stay up and usable until the new ones are synced
         status_bar = self.query_one("#status-bar", Static)
-        status_bar.update("🔄 Fetching PRs...")
+        if self._row_state:
+            status_bar.update(f"📊 {len(self._row_state)} PRs | 🔄 Refreshing...")
+        else:
+            status_bar.update("🔄 Fetching PRs...")
 
         boxes = self.config.get("boxes", [])
-        accounts = self.config.get("accounts", [])
-        accounts_by_id = {a["id"]: a for a in accounts}
+        accounts_by_id = {a["id"]: a for a in self.config.get("accounts", [])}
 
         # Build (box, account) pairs and fetch all in parallel
         fetch_pairs = [
@@ -542,24 +1003,52 @@ class PRDashboard(App):
             return_exceptions=True,
         )
 
+        now = datetime.now(timezone.utc)
+
         # Process PRs grouped by box label (preserving box order)
         pr_rows_by_query: dict[str, list] = {box["label"]: [] for box in boxes}
         seen_prs_by_box: dict[str, set] = {box["label"]: set() for box in boxes}
+        # Account label -> auth headers and GraphQL endpoint for phase 2, taken from the searches
+        account_creds: dict[str, dict[str, Any]] = {}
+        # Rows needing phase 2 (carried-over rows from failed searches are left as shown)
+        all_pr_rows = []
 
-        for result in raw_results:
-            if isinstance(result, Exception):
+        for (box, account), result in zip(fetch_pairs, raw_results):
+            if isinstance(result, Exception) or result[3] is None:
+                if isinstance(result, Exception):
+                    account_label = account.get("label", account.get("id", "Unknown"))
+                    self.notify(
+                        f"Error fetching {box.get('label', 'PRs')} for {account_label}: {result}",
+                        severity="error"
+                    )
+                # A failed search is not an empty box: keep showing what it found last time
+                self._carry_over_rows(box, account, pr_rows_by_query, seen_prs_by_box)
                 continue
-            account_label, username, query_label, prs = result
+            account_label, username, query_label, prs, headers = result
+            if headers is not None and account_label not in account_creds:
+                account_creds[account_label] = {
+                    "headers": headers,
+                    "graphql_url": graphql_url(account.get("api_base", "https://api.github.com")),
+                }
             if query_label not in pr_rows_by_query:
                 continue
 
+            # Bind the box's row list and seen-set once rather than per PR
+            rows_append = pr_rows_by_query[query_label].append
+            seen_prs = seen_prs_by_box[query_label]
+            seen_add = seen_prs.add
+
+            # GitHub logins are case-insensitive; lowercase the values compared per PR once per result
+            username_lc = username.lower() if username else ""
+            query_label_lc = query_label.lower()
+
             for pr in prs:
                 pr_id = pr["id"]
 
                 # Skip duplicates within the same box (e.g., same PR from two accounts)
-                if pr_id in seen_prs_by_box[query_label]:
+                if pr_id in seen_prs:
                     continue
-                seen_prs_by_box[query_label].add(pr_id)
+                seen_add(pr_id)
 
                 # Detect closed PR and short-circuit status determination
                 is_closed = pr.get("state") == "closed"
@@ -569,187 +1058,295 @@ class PRDashboard(App):
                     priority = Priority.LOW
                     checks_placeholder = "—"
                 else:
-                    priority, status = self.determine_pr_status(pr, query_label, username)
+                    priority, status = self.determine_pr_status(pr, query_label_lc, username_lc)
                     checks_placeholder = "⚪"
 
+                row_key = f"{account_label}_{pr_id}"
+
+                # Keep showing the last known checks/status until phase 2 revalidates them,
+                # so unchanged rows are not flipped back to placeholders on every refresh
+                previous = self._row_state.get((query_label, row_key))
+                if previous is not None and not is_closed:
+                    priority = previous["priority"]
+                    status = previous["status"]
+                    checks_placeholder = previous["checks"]
+
                 state = query_label
                 if not is_closed and pr.get("draft", False):
                     state = f"{query_label} (Draft)"
 
                 repo_name = self.extract_repo_name(pr["repository_url"])
-                row_key = f"{account_label}_{pr_id}"
+                try:
+                    age_seconds = (now - parse_timestamp(pr["created_at"])).total_seconds()
+                except Exception:
+                    age_seconds = float("inf")  # Unparseable timestamps sort last
                 row_data = {
                     "priority": priority,
                     "status": status,
                     "account": account_label,
-                    "account_username": username,
+                    "username_lc": username_lc,
                     "state": state,
                     "repo": repo_name,
                     "title": pr["title"],
                     "author": pr["user"]["login"],
-                    "age": self.calculate_age(pr["created_at"]),
+                    "age": self.calculate_age(pr["created_at"], now),
+                    "age_seconds": age_seconds,
                     "url": pr["html_url"],
                     "key": row_key,
+                    "pr_id": pr_id,
+                    "number": pr["number"],
                     "checks": checks_placeholder,
                     "pr": pr,
-                    "original_query_label": query_label,
-                    "assignees": pr.get("assignees", []),
                     "query_label": query_label,
                     "is_closed": is_closed,
                 }
-                pr_rows_by_query[query_label].append(row_data)
+                rows_append(row_data)
+                all_pr_rows.append(row_data)
 
-        # Flatten all rows
-        all_pr_rows = []
+        # Sort each box's rows by priority then age (newest first)
         for rows in pr_rows_by_query.values():
-            all_pr_rows.extend(rows)
+            rows.sort(key=ROW_SORT_KEY)
 
-        # Sort each box's rows by priority then age
-        for query_label in pr_rows_by_query:
-            pr_rows_by_query[query_label].sort(key=lambda x: (x["priority"], x["age"]))
+        # --- Phase 1: Sync the tables with the new rows and show them immediately ---
+        total_prs = await self._sync_tables(pr_rows_by_query)
 
-        # --- Phase 1: Build and mount tables immediately ---
-        main_container = self.query_one("#main-container", Container)
-        await main_container.remove_children()
+        status_bar.update(f"📊 {total_prs} PRs | 🔄 Loading checks...")
 
-        row_to_table: dict[str, DataTable] = {}
-        row_col_keys: dict[str, tuple] = {}
+        # --- Phase 2: Fetch check statuses in the background (skip closed PRs) ---
+        self.run_worker(
+            self._load_check_statuses(all_pr_rows, account_creds, total_prs),
+            group="checks",
+            exclusive=True,
+        )
 
+    def _carry_over_rows(
+        self,
+        box: dict,
+        account: dict,
+        pr_rows_by_query: dict[str, list],
+        seen_prs_by_box: dict[str, set]
+    ) -> None:
+        """Re-add the rows a failed (box, account) search showed last refresh, unchanged."""
+        query_label = box.get("label")
+        if query_label not in pr_rows_by_query:
+            return
+        account_label = account.get("label", account.get("id", "Unknown"))
+        rows = pr_rows_by_query[query_label]
+        seen_prs = seen_prs_by_box[query_label]
+        for (label, _), row in self._row_state.items():
+            if label == query_label and row["account"] == account_label and row["pr_id"] not in seen_prs:
+                seen_prs.add(row["pr_id"])
+                rows.append(row)
+
+    async def _sync_tables(self, pr_rows_by_query: dict[str, list]) -> int:
+        """
+        Bring the mounted sections in line with freshly fetched rows.
+
+        Each box's section and DataTable are created once and reused; within a table
+        only rows that appeared, disappeared or changed are touched.
+
+        Args:
+            pr_rows_by_query: Sorted row dicts per box label, in box order
+
+        Returns:
+            Total number of rows displayed
+        """
+        main_container = self.query_one("#main-container", Container)
+        row_state: dict[tuple[str, str], dict[str, Any]] = {}
+        pr_urls: dict[str, str] = {}
+        previous_section = None
         total_prs = 0
-        for query_label, pr_rows in pr_rows_by_query.items():
-            if not pr_rows:
+
+        # Repaint once when every section is synced, not after each row mutation
+        with self.batch_update():
+            for query_label, pr_rows in pr_rows_by_query.items():
+                section = self._sections.get(query_label)
+                if not pr_rows:
+                    if section is not None:
+                        await section[0].remove()
+                        del self._sections[query_label]
+                    continue
+
+                title_text = f"📌 {query_label} ({len(pr_rows)})"
+                if section is None:
+                    title = Static(title_text, classes="query-title")
+                    table = DataTable(cursor_type="row", zebra_stripes=True)
+                    for header, column_key in TABLE_COLUMNS:
+                        table.add_column(header, key=column_key)
+                    container = Vertical(title, table, classes="query-section")
+
+                    # Keep sections in box order
+                    if previous_section is not None:
+                        await main_container.mount(container, after=previous_section)
+                    elif main_container.children:
+                        await main_container.mount(container, before=0)
+                    else:
+                        await main_container.mount(container)
+                    self._sections[query_label] = (container, title, table)
+                else:
+                    container, title, table = section
+                    if table.row_count != len(pr_rows):
+                        title.update(title_text)
+
+                self._sync_rows(query_label, table, pr_rows)
+
+                pr_urls.update({row["key"]: row["url"] for row in pr_rows})
+                row_state.update({(query_label, row["key"]): row for row in pr_rows})
+                previous_section = container
+                total_prs += len(pr_rows)
+
+            # Drop sections for boxes that are no longer configured
+            for query_label in [label for label in self._sections if label not in pr_rows_by_query]:
+                await self._sections.pop(query_label)[0].remove()
+
+        self._row_state = row_state
+        self.pr_urls = pr_urls
+        return total_prs
+
+    def _sync_rows(self, query_label: str, table: DataTable, pr_rows: list[dict[str, Any]]) -> None:
+        """
+        Apply the difference between a table's current rows and pr_rows (already sorted).
+
+        Vanished rows are removed, new ones appended and changed cells patched; the
+        table is then re-sorted in place, and the cursor stays on the PR it was on.
+        """
+        new_key_set = {row["key"] for row in pr_rows}
+        old_keys = [row_key.value for row_key in table.rows]
+        cursor_key = self._cursor_row_key(table)
+
+        for key in old_keys:
+            if key not in new_key_set:
+                table.remove_row(key)
+
+        old_key_set = set(old_keys)
+        for row in pr_rows:
+            cells = self._row_cells(row)
+            if row["key"] not in old_key_set:
+                table.add_row(*cells, key=row["key"])
                 continue
 
-            title = Static(f"📌 {query_label} ({len(pr_rows)})", classes="query-title")
-
-            table = DataTable(cursor_type="row", zebra_stripes=True)
-            col_keys = table.add_columns(
-                "Status",
-                "Checks",
-                "Account",
-                "Type",
-                "Repo",
-                "Title",
-                "Author",
-                "Age",
-            )
-            status_col_key = col_keys[0]
-            checks_col_key = col_keys[1]
-
-            for row in pr_rows:
-                table.add_row(
-                    row["status"],
-                    row["checks"],
-                    row["account"],
-                    row["state"],
-                    row["repo"],
-                    row["title"],
-                    row["author"],
-                    row["age"],
-                    key=row["key"],
-                )
-                self.pr_urls[row["key"]] = row["url"]
-                row_to_table[row["key"]] = table
-                row_col_keys[row["key"]] = (checks_col_key, status_col_key)
-                total_prs += 1
+            previous = self._row_state.get((query_label, row["key"]))
+            old_cells = self._row_cells(previous) if previous is not None else tuple(table.get_row(row["key"]))
+            for (_, column_key), old, new in zip(TABLE_COLUMNS, old_cells, cells):
+                if old != new:
+                    table.update_cell(row["key"], column_key, new, update_width=True)
 
-            section = Vertical(title, table, classes="query-section")
-            await main_container.mount(section)
+        self._sort_table(table, pr_rows)
+        self._restore_cursor(table, cursor_key)
 
-        status_bar.update(f"📊 {total_prs} PRs | 🔄 Loading checks...")
+    def _sort_table(self, table: DataTable, pr_rows: list[dict[str, Any]]) -> None:
+        """Reorder a table's rows to match pr_rows (sorted row dicts) without rebuilding it."""
+        if [row.key.value for row in table.ordered_rows] == [row["key"] for row in pr_rows]:
+            return
+        # DataTable.sort hands the key function a row's cell values, not its row key.
+        # Rows with identical cells are indistinguishable on screen, so sharing a rank is fine
+        rank = {self._row_cells(row): index for index, row in enumerate(pr_rows)}
+        table.sort(key=lambda cells: rank.get(tuple(cells), len(rank)))
+
+    def _resort_tables(self) -> None:
+        """Re-sort every section after phase 2 has changed row priorities."""
+        rows_by_query: dict[str, list] = {}
+        for (query_label, _), row in self._row_state.items():
+            rows_by_query.setdefault(query_label, []).append(row)
+
+        with self.batch_update():
+            for query_label, rows in rows_by_query.items():
+                section = self._sections.get(query_label)
+                if section is None:
+                    continue
+                table = section[2]
+                cursor_key = self._cursor_row_key(table)
+                self._sort_table(table, sorted(rows, key=ROW_SORT_KEY))
+                self._restore_cursor(table, cursor_key)
+
+    @staticmethod
+    def _cursor_row_key(table: DataTable) -> str | None:
+        """Return the key of the row under a table's cursor, if any."""
+        try:
+            return table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+        except Exception:
+            return None
+
+    @staticmethod
+    def _restore_cursor(table: DataTable, row_key: str | None) -> None:
+        """Put the cursor back on row_key after rows were added, removed or reordered."""
+        if row_key is not None and row_key in table.rows:
+            index = table.get_row_index(row_key)
+            if index != table.cursor_row:
+                table.move_cursor(row=index, animate=False)
+
+    def _row_cells(self, row: dict[str, Any]) -> tuple:
+        """Return a row's cell values in TABLE_COLUMNS order."""
+        return tuple(row[column_key] for _, column_key in TABLE_COLUMNS)
+
+    def _update_row_cell(self, row_data: dict[str, Any], column_key: str, value: str) -> None:
+        """Patch one cell of a displayed row, if its table still shows it."""
+        section = self._sections.get(row_data["query_label"])
+        if section is not None and row_data["key"] in section[2].rows:
+            section[2].update_cell(row_data["key"], column_key, value)
+
+    async def _load_check_statuses(
+        self,
+        all_pr_rows: list[dict[str, Any]],
+        account_creds: dict[str, dict[str, Any]],
+        total_prs: int
+    ) -> None:
+        """
+        Phase 2 of refresh_data: fetch check statuses and patch the mounted tables.
+
+        Runs as an exclusive worker in the "checks" group, so starting a new refresh
+        cancels lookups still in flight for a board that is about to be torn down.
+        account_creds maps account labels to the headers and GraphQL endpoint their
+        searches used.
+        """
+        status_bar = self.query_one("#status-bar", Static)
 
-        # --- Phase 2: Fetch check statuses in parallel (skip closed PRs) ---
         if all_pr_rows:
-            account_creds = {}
-            for account in accounts:
-                account_label = account.get("label", account.get("id", "Unknown"))
-                token_env_var = account.get("token_env_var")
-                if token_env_var:
-                    token = os.getenv(token_env_var)
-                    if token:
-                        api_base = account.get("api_base", "https://api.github.com")
-                        account_creds[account_label] = {
-                            "headers": {
-                                "Authorization": f"token {token}",
-                                "Accept": "application/vnd.github.v3+json",
-                            }
-                        }
-
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                async def _fetch_check(row_data):
-                    if row_data.get("is_closed"):
-                        return row_data, None, None
-                    acct_label = row_data["account"]
-                    if acct_label not in account_creds:
-                        return row_data, None, None
-                    creds = account_creds[acct_label]
+            semaphores = {
+                acct_label: asyncio.Semaphore(CHECK_STATUS_CONCURRENCY) for acct_label in account_creds
+            }
+
+            async def _fetch_check(same_pr_rows):
+                # Rows of one PR shown in several boxes share a single REST lookup
+                acct_label = same_pr_rows[0]["account"]
+                async with semaphores[acct_label]:
                     check_status, reviewer_info = await self.get_check_status(
-                        row_data["pr"], creds["headers"], client
+                        same_pr_rows[0]["pr"], account_creds[acct_label]["headers"], self.http
                     )
-                    return row_data, check_status, reviewer_info
-
-                check_results = await asyncio.gather(
-                    *[_fetch_check(rd) for rd in all_pr_rows],
+                for row_data in same_pr_rows:
+                    self._apply_check_result(row_data, check_status, reviewer_info)
+
+            async def _fetch_account_checks(acct_label, rows):
+                # One GraphQL request per GRAPHQL_BATCH_SIZE PRs of the account (batches run
+                # concurrently); whatever they could not resolve falls back to the per-PR REST lookups
+                creds = account_creds[acct_label]
+                resolved = await self.fetch_checks_graphql(
+                    rows, creds["graphql_url"], creds["headers"], self.http
+                )
+                unresolved: dict[str, list] = {}
+                for row in rows:
+                    if row["key"] in resolved:
+                        self._apply_check_result(row, *resolved[row["key"]])
+                    else:
+                        unresolved.setdefault(row["key"], []).append(row)
+                await asyncio.gather(
+                    *[_fetch_check(same_pr_rows) for same_pr_rows in unresolved.values()],
                     return_exceptions=True,
                 )
 
-            for result in check_results:
-                if isinstance(result, Exception):
-                    continue
-                row_data, check_status, reviewer_info = result
-                if check_status is None:
-                    continue
-                row_data["checks"] = check_status
-                row_data["reviewer_info"] = reviewer_info
-                key = row_data["key"]
-                if key in row_to_table:
-                    checks_col, _ = row_col_keys[key]
-                    row_to_table[key].update_cell(key, checks_col, check_status)
-
-        # Update priority based on reviewer info and check status; patch status cells
-        for row_data in all_pr_rows:
-            # Skip closed PRs entirely — status is already final
-            if row_data.get("is_closed"):
-                row_data.pop("is_closed", None)
-                row_data.pop("pr", None)
-                row_data.pop("account_username", None)
-                row_data.pop("reviewer_info", None)
-                row_data.pop("assignees", None)
-                row_data.pop("original_query_label", None)
-                continue
-
-            username = row_data.get("account_username", "")
-            author = row_data["author"]
-            is_my_pr = author.lower() == username.lower() if username else False
+            # Closed PRs keep their "—" placeholder; accounts without a token are skipped
+            rows_by_account: dict[str, list] = {}
+            for row_data in all_pr_rows:
+                if not row_data["is_closed"] and row_data["account"] in account_creds:
+                    rows_by_account.setdefault(row_data["account"], []).append(row_data)
 
-            old_status = row_data["status"]
+            await asyncio.gather(
+                *[_fetch_account_checks(label, rows) for label, rows in rows_by_account.items()],
+                return_exceptions=True,
+            )
 
-            if "reviewer_info" in row_data:
-                priority, status = self.determine_pr_status(
-                    {"user": {"login": author}, "assignees": row_data.get("assignees", [])},
-                    row_data.get("original_query_label", ""),
-                    username,
-                    row_data["reviewer_info"]
-                )
-                row_data["priority"] = priority
-                row_data["status"] = status
-
-            if is_my_pr and row_data["checks"] == "❌":
-                row_data["priority"] = Priority.HIGH
-                row_data["status"] = "🔴 Checks Failing"
-
-            if row_data["status"] != old_status:
-                key = row_data["key"]
-                if key in row_to_table:
-                    _, status_col = row_col_keys[key]
-                    row_to_table[key].update_cell(key, status_col, row_data["status"])
-
-            row_data.pop("pr", None)
-            row_data.pop("account_username", None)
-            row_data.pop("reviewer_info", None)
-            row_data.pop("assignees", None)
-            row_data.pop("original_query_label", None)
-            row_data.pop("is_closed", None)
+            # Phase 1 sorted on the last known priorities; order by the revalidated ones
+            self._resort_tables()
 
         self.last_update = datetime.now()
         status_text = f"📊 {total_prs} PRs | Last updated: {self.last_update.strftime('%H:%M:%S')}"
@@ -757,8 +1354,44 @@ class PRDashboard(App):
 
         self.notify(f"Dashboard updated: {total_prs} PRs found")
 
+    def _apply_check_result(
+        self,
+        row_data: dict[str, Any],
+        check_status: str,
+        reviewer_info: dict[str, Any]
+    ) -> None:
+        """
+        Record a PR's check status, re-evaluate its priority and patch the changed cells.
+
+        Reviewer info can demote a review request to a team review, and failing checks
+        on your own PR elevate it to HIGH.
+        """
+        row_data["checks"] = check_status
+        self._update_row_cell(row_data, "checks", check_status)
+
+        old_status = row_data["status"]
+        username_lc = row_data["username_lc"]
+        priority, status = self.determine_pr_status(
+            row_data["pr"], row_data["query_label"].lower(), username_lc, reviewer_info
+        )
+
+        is_my_pr = row_data["author"].lower() == username_lc if username_lc else False
+        if is_my_pr and check_status == "❌":
+            priority, status = Priority.HIGH, "🔴 Checks Failing"
+
+        row_data["priority"] = priority
+        row_data["status"] = status
+        if status != old_status:
+            self._update_row_cell(row_data, "status", status)
+
+        # The full search result is only needed until the row has been re-evaluated
+        row_data.pop("pr", None)
+
     def action_refresh(self) -> None:
         """Handle refresh action."""
+        # Leading-edge debounce: the first press refreshes, repeats right after it are ignored
+        if time.monotonic() - self._last_refresh_ts < REFRESH_DEBOUNCE_SECONDS:
+            return
         self.run_worker(self.refresh_data())
 
     def action_open_pr(self) -> None:
@@ -789,13 +1422,14 @@ class PRDashboard(App):
             if not row_key:
                 return
 
-            # Find the actual key by looking at the coordinate
-            cursor_coord = table.cursor_coordinate
-            if cursor_coord and cursor_coord.row < len(table.rows):
-                actual_key = list(table.rows.keys())[cursor_coord.row]
+            # Resolve the key of the row on screen under the cursor (rows may have been re-sorted)
+            actual_key = self._cursor_row_key(table)
+            if actual_key is not None:
                 pr_url = self.pr_urls.get(actual_key)
 
                 if pr_url:
+                    import webbrowser  # Imported lazily; only needed once a PR is opened
+
                     # Works in VSCode Remote SSH (intercepted) and native Linux with display.
                     # Silently fails in plain SSH terminals — the link below handles that case.
                     webbrowser.open(pr_url)
@@ -815,6 +1449,18 @@ class PRDashboard(App):
 
 def main():
     """Main entry point for the application."""
+    # uvloop is a faster drop-in event loop; not available on Windows.
+    # Event loop policies are deprecated from Python 3.14 (and slated for removal), so
+    # newer interpreters keep the default loop. Replace this with a loop factory once
+    # the minimum supported Textual can be handed one.
+    if sys.version_info < (3, 14):
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     app = PRDashboard()
     app.run()
 